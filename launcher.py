@@ -4,7 +4,8 @@ import os
 
 if getattr(sys, 'frozen', False):
     application_path = os.path.dirname(sys.executable)
-    sys.path.insert(0, application_path)
+    if application_path not in sys.path:
+        sys.path.insert(0, application_path)
 
 from src.main import main
 
@@ -1,5 +1,6 @@
 import os
-import platform
+import sys
+from types import MappingProxyType
 
 APP_NAME = "Nova Launcher"
 APP_VERSION = "1.0.0"
@@ -7,15 +8,14 @@ APP_AUTHOR = "Nova Team"
 
 ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 RESOURCES_DIR = os.path.join(ROOT_DIR, "resources")
+HOME_DIR = os.path.expanduser("~")
 
-if platform.system() == "Windows":
-    DEFAULT_MINECRAFT_DIR = os.path.join(os.path.expanduser("~"), "AppData", "Roaming", ".minecraft")
+if sys.platform == "win32":
+    DEFAULT_MINECRAFT_DIR = os.path.join(HOME_DIR, "AppData", "Roaming", ".minecraft")
 else:
-    DEFAULT_MINECRAFT_DIR = os.path.join(os.path.expanduser("~"), ".minecraft")
+    DEFAULT_MINECRAFT_DIR = os.path.join(HOME_DIR, ".minecraft")
 
-USER_CONFIG_FILE = os.path.join(ROOT_DIR, "user_config.json")
-
-DEFAULT_SETTINGS = {
+DEFAULT_SETTINGS = MappingProxyType({
     "minecraft_directory": DEFAULT_MINECRAFT_DIR,
     "username": "Player",
     "last_used_version": None,
@@ -24,11 +24,28 @@ DEFAULT_SETTINGS = {
     "show_fabric": True,
     "show_forge": True,
     "show_snapshots": False
-}
+})
 
 LOGO_PATH = os.path.join(RESOURCES_DIR, "logo.png")
 
-SETTINGS_FILE = os.path.join(DEFAULT_MINECRAFT_DIR, "novasettings.json")
+VERSION_MANIFEST_URL = "https://launchermeta.mojang.com/mc/game/version_manifest_v2.json"
+VERSION_CACHE_FILE_NAME = "version_manifest_cache.json"
+VERSION_CACHE_MAX_AGE = 6 * 60 * 60
+FORGE_CACHE_FILE_NAME = "forge_versions_cache.json"
+FORGE_CACHE_MAX_AGE = 24 * 60 * 60
+IMAGE_CACHE_DIR_NAME = "image_cache"
+
+# Paths the launcher itself doesn't read; resolved on first access
+_LAZY_PATHS = {
+    "USER_CONFIG_FILE": lambda: os.path.join(ROOT_DIR, "user_config.json"),
+    "SETTINGS_FILE": lambda: os.path.join(DEFAULT_MINECRAFT_DIR, "novasettings.json"),
+}
+
+def __getattr__(name):
+    if name in _LAZY_PATHS:
+        value = globals()[name] = _LAZY_PATHS[name]()
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 DEFAULT_JAVA_PATH = ""
 DEFAULT_RAM_ALLOCATION = 2048
@@ -38,4 +55,296 @@ SECONDARY_COLOR = "#3d6b2c"
 BACKGROUND_COLOR = "#2d2d2d"
 TEXT_COLOR = "#e0e0e0"
 HOVER_COLOR = "#4e8a38"
-PRESSED_COLOR = "#3d6b2c"
\ No newline at end of file
+PRESSED_COLOR = "#3d6b2c"
+
+MAIN_WINDOW_STYLESHEET = """
+    QMainWindow, QWidget {
+        background-color: #2d2d2d;
+        color: #e0e0e0;
+    }
+    #titleBar {
+        background-color: #1e1e1e;
+    }
+    #contentWidget {
+        background-color: #2d2d2d;
+    }
+    QGroupBox {
+        border: 1px solid #3d3d3d;
+        border-radius: 5px;
+        margin-top: 10px;
+        font-weight: bold;
+        color: #e0e0e0;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QLabel {
+        color: #e0e0e0;
+    }
+    QLabel#titleLabel {
+        color: #5ba042;
+        font-weight: bold;
+    }
+    QComboBox {
+        background-color: #3d3d3d;
+        color: #e0e0e0;
+        border: 1px solid #5d5d5d;
+        padding: 4px;
+        border-radius: 4px;
+    }
+    QComboBox::drop-down {
+        border: none;
+    }
+    QLineEdit {
+        background-color: #3d3d3d;
+        color: #e0e0e0;
+        border: 1px solid #5d5d5d;
+        padding: 4px;
+        border-radius: 4px;
+    }
+    QPushButton {
+        background-color: #3d3d3d;
+        color: #e0e0e0;
+        border: 1px solid #5d5d5d;
+        border-radius: 4px;
+        padding: 8px 16px;
+    }
+    QPushButton:hover {
+        background-color: #4d4d4d;
+    }
+    QPushButton:pressed {
+        background-color: #2d2d2d;
+    }
+    QPushButton#playButton {
+        background-color: #5ba042;
+        color: white;
+        border: none;
+        font-weight: bold;
+        font-size: 16px;
+    }
+    QPushButton#playButton:hover {
+        background-color: #4e8a38;
+    }
+    QPushButton#playButton:pressed {
+        background-color: #3d6b2c;
+    }
+    QPushButton#playButton[state="installing"] {
+        background-color: #6c6c6c;
+    }
+    QPushButton#minimizeBtn, QPushButton#closeBtn {
+        background-color: transparent;
+        color: #dddddd;
+        border: none;
+        font-size: 16px;
+        font-weight: bold;
+        padding: 0px;
+        margin: 0px;
+        border-radius: 0px;
+    }
+    QPushButton#minimizeBtn:hover {
+        background-color: #3d3d3d;
+        color: #ffffff;
+    }
+    QPushButton#closeBtn:hover {
+        background-color: #c42b1c;
+        color: #ffffff;
+    }
+    QProgressBar {
+        border: 1px solid #5d5d5d;
+        border-radius: 4px;
+        text-align: center;
+        background-color: #3d3d3d;
+    }
+    QProgressBar::chunk {
+        background-color: #5ba042;
+        width: 20px;
+    }
+    #titleLogo, #titleText, #windowControls {
+        background-color: #1e1e1e;
+    }
+    #userWidget {
+        background-color: #2d2d2d;
+        border-radius: 4px;
+        padding: 0px;
+    }
+    QLabel#userLabel {
+        color: #e0e0e0;
+        font-size: 13px;
+    }
+    QPushButton#settingsButton {
+        background-color: transparent;
+        border: none;
+        border-radius: 18px;
+        padding: 0px;
+        color: #e0e0e0;
+    }
+    QPushButton#settingsButton:hover {
+        background-color: #3d3d3d;
+    }
+    QPushButton#settingsButton:pressed {
+        background-color: #2d2d2d;
+    }
+    QFrame#headerSeparator {
+        background-color: #3d3d3d;
+    }
+    QFrame#loadingContainer {
+        background-color: #2d2d2d;
+        border-radius: 6px;
+        border: 1px solid #5ba042;
+    }
+    QLabel#statusLabel {
+        color: #5ba042;
+    }
+"""
+
+USER_INFO_DIALOG_STYLESHEET = """
+    QDialog#userInfoDialog {
+        background-color: #2d2d2d;
+        color: #e0e0e0;
+    }
+    #userInfoDialog QLabel {
+        color: #e0e0e0;
+    }
+    #userInfoDialog QLineEdit {
+        background-color: #3d3d3d;
+        color: #e0e0e0;
+        border: 1px solid #5d5d5d;
+        padding: 8px;
+        border-radius: 4px;
+        font-size: 14px;
+    }
+    #userInfoDialog QLineEdit:focus {
+        border: 1px solid #5ba042;
+    }
+    #userInfoDialog QPushButton {
+        background-color: #5ba042;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-weight: bold;
+    }
+    #userInfoDialog QPushButton:hover {
+        background-color: #4e8a38;
+    }
+    #userInfoDialog QPushButton:pressed {
+        background-color: #3d6b2c;
+    }
+"""
+
+SETTINGS_DIALOG_STYLESHEET = """
+    QDialog#settingsDialog {
+        background-color: #2d2d2d;
+        color: #e0e0e0;
+    }
+    #settingsDialog #titleBar {
+        background-color: #1e1e1e;
+    }
+    #settingsDialog QTabWidget::pane {
+        border: 1px solid #3d3d3d;
+        background-color: #2d2d2d;
+        border-radius: 4px;
+    }
+    #settingsDialog QTabBar::tab {
+        background-color: #3d3d3d;
+        color: #e0e0e0;
+        padding: 8px 16px;
+        border: 1px solid #4d4d4d;
+        border-bottom: none;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+        margin-right: 2px;
+    }
+    #settingsDialog QTabBar::tab:selected {
+        background-color: #4d4d4d;
+        color: #ffffff;
+    }
+    #settingsDialog QLabel {
+        color: #e0e0e0;
+    }
+    #settingsDialog QComboBox, #settingsDialog QSpinBox {
+        background-color: #3d3d3d;
+        color: #e0e0e0;
+        border: 1px solid #5d5d5d;
+        padding: 4px;
+        border-radius: 4px;
+    }
+    #settingsDialog QComboBox::drop-down {
+        border: none;
+    }
+    #settingsDialog QSlider::groove:horizontal {
+        border: 1px solid #5d5d5d;
+        height: 8px;
+        background: #3d3d3d;
+        margin: 2px 0;
+        border-radius: 4px;
+    }
+    #settingsDialog QSlider::handle:horizontal {
+        background: #5ba042;
+        border: 1px solid #5ba042;
+        width: 18px;
+        margin: -8px 0;
+        border-radius: 9px;
+    }
+    #settingsDialog QPushButton {
+        background-color: #5ba042;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 6px 12px;
+    }
+    #settingsDialog QPushButton:hover {
+        background-color: #4e8a38;
+    }
+    #settingsDialog QPushButton:pressed {
+        background-color: #3d6b2c;
+    }
+    #settingsDialog QPushButton#cancelButton {
+        background-color: #3d3d3d;
+        color: #e0e0e0;
+        border: 1px solid #5d5d5d;
+    }
+    #settingsDialog QPushButton#cancelButton:hover {
+        background-color: #4d4d4d;
+    }
+    #settingsDialog QPushButton#minimizeBtn, #settingsDialog QPushButton#closeBtn {
+        background-color: transparent;
+        color: #dddddd;
+        border: none;
+        font-size: 16px;
+        font-weight: bold;
+        padding: 0px;
+        margin: 0px;
+        border-radius: 0px;
+    }
+    #settingsDialog QPushButton#minimizeBtn:hover {
+        background-color: #3d3d3d;
+        color: #ffffff;
+    }
+    #settingsDialog QPushButton#closeBtn:hover {
+        background-color: #c42b1c;
+        color: #ffffff;
+    }
+    #settingsDialog QCheckBox {
+        color: #e0e0e0;
+    }
+    #settingsDialog QLabel#titleText {
+        color: #e0e0e0;
+        font-weight: bold;
+    }
+    #settingsDialog QLabel#pathLabel {
+        font-size: 13px;
+        color: #aaaaaa;
+        background-color: #3d3d3d;
+        padding: 5px;
+        border-radius: 3px;
+    }
+    #settingsDialog QComboBox#usernameCombo {
+        padding: 2px 5px;
+    }
+"""
+
+# Applied once to QApplication; per-widget differences use #objectName selectors
+STYLESHEET = MAIN_WINDOW_STYLESHEET + USER_INFO_DIALOG_STYLESHEET + SETTINGS_DIALOG_STYLESHEET
@@ -1,77 +1,440 @@
 import sys
 import os
 import json
-import requests
-import minecraft_launcher_lib as mclib
-import minecraft_launcher_lib.fabric as fabric
-import minecraft_launcher_lib.forge as forge
 import subprocess
 import uuid
+import queue
+import re
 import hashlib
 import time
-import base64
-import math
-import traceback
-import glob
+import logging
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                            QLabel, QPushButton, QComboBox, QProgressBar, 
                            QMessageBox, QFileDialog, QGroupBox, QHBoxLayout, QGridLayout,
                            QDialog, QSpinBox, QSlider, QTabWidget, QInputDialog,
-                           QFrame, QLineEdit, QCheckBox)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSize, QTimer, QByteArray
-from PyQt5.QtGui import QIcon, QPixmap, QFont, QPainter, QColor, QPainterPath
+                           QFrame, QLineEdit, QCheckBox, QStackedWidget)
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSize, QTimer, QByteArray, QEvent
+from PyQt5.QtGui import QIcon, QPixmap, QImage, QPixmapCache, QFont, QPainter, QColor, QPainterPath
 
 from .config import *
 
+logger = logging.getLogger(__name__)
+
+LOGO_EXISTS = os.path.exists(LOGO_PATH)
+AVATAR_PATH = os.path.join(RESOURCES_DIR, "creeper.jpg")
+AVATAR_EXISTS = os.path.exists(AVATAR_PATH)
+HEADER_PATH = os.path.join(RESOURCES_DIR, "header.png")
+HEADER_EXISTS = os.path.exists(HEADER_PATH)
+
+def pixmap_cache_key(path, width=None, height=None):
+    return f"nova:{path}@{width}x{height}"
+
+def scale_image(image, width=None, height=None):
+    if width and height:
+        return image.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    elif height:
+        return image.scaledToHeight(height, Qt.SmoothTransformation)
+    return image
+
+def render_spinner_frame(angle):
+    spinner_pixmap = QPixmap(30, 30)
+    spinner_pixmap.fill(Qt.transparent)
+    
+    painter = QPainter(spinner_pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QColor(80, 80, 80, 80))
+    painter.drawEllipse(3, 3, 24, 24)
+    
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QColor(PRIMARY_COLOR))
+    
+    path = QPainterPath()
+    path.moveTo(15, 15)
+    path.arcTo(3, 3, 24, 24, angle, 120)
+    path.lineTo(15, 15)
+    painter.drawPath(path)
+    
+    painter.end()
+    
+    return spinner_pixmap
+
+SPINNER_FRAME_COUNT = 24
+
+def get_spinner_frame(index):
+    key = f"nova:spinner@{index}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        pixmap = render_spinner_frame(index * 360 // SPINNER_FRAME_COUNT)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+def dump_settings(settings):
+    if orjson is not None:
+        return orjson.dumps(settings)
+    return json.dumps(settings, separators=(",", ":")).encode("utf-8")
+
+def parse_settings(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+@lru_cache(maxsize=None)
+def get_logo_icon():
+    return QIcon(LOGO_PATH)
+
+@lru_cache(maxsize=None)
+def get_title_logo_pixmap():
+    return QPixmap(LOGO_PATH).scaled(20, 20, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+@lru_cache(maxsize=None)
+def get_default_avatar_pixmap():
+    avatar_pixmap = QPixmap(26, 26)
+    avatar_pixmap.fill(Qt.transparent)
+    painter = QPainter(avatar_pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setBrush(QColor(PRIMARY_COLOR))
+    painter.setPen(Qt.NoPen)
+    painter.drawEllipse(0, 0, 26, 26)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QColor(255, 255, 255))
+    painter.drawEllipse(9, 4, 8, 8)
+    path = QPainterPath()
+    path.moveTo(13, 12)
+    path.lineTo(17, 22)
+    path.lineTo(9, 22)
+    path.lineTo(13, 12)
+    painter.drawPath(path)
+    painter.end()
+    return avatar_pixmap
+
+@lru_cache(maxsize=32)
 def create_icon_from_base64(base64_str):
-    base64_str = base64_str.strip()
-    icon_data = base64.b64decode(base64_str)
+    icon_data = QByteArray.fromBase64(base64_str.strip().encode("ascii"))
     pixmap = QPixmap()
     pixmap.loadFromData(icon_data)
     return QIcon(pixmap)
 
+@lru_cache(maxsize=64)
 def generate_uuid_from_username(username):
-    namespace = uuid.NAMESPACE_OID
-    username_uuid = uuid.uuid5(namespace, username)
-    return str(username_uuid)
+    # uuid.uuid5(NAMESPACE_OID, username) without building a UUID object
+    digest = bytearray(hashlib.sha1(uuid.NAMESPACE_OID.bytes + username.encode("utf-8")).digest()[:16])
+    digest[6] = (digest[6] & 0x0f) | 0x50
+    digest[8] = (digest[8] & 0x3f) | 0x80
+    h = digest.hex()
+    return f"{h[0:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}"
+
+# Combo box item data
+VersionData = namedtuple("VersionData", "id type forge_version", defaults=(None,))
+
+# Empty username makes the launcher ask for one on first start
+LAUNCHER_DEFAULT_SETTINGS = MappingProxyType({
+    **DEFAULT_SETTINGS,
+    "username": "",
+    "last_version_type": None
+})
+
+# Settings file key -> NovaLauncher attribute
+SETTINGS_ATTRIBUTES = (
+    ("minecraft_directory", "minecraft_directory"),
+    ("username", "username"),
+    ("last_used_version", "selected_version"),
+    ("last_version_type", "selected_version_type"),
+    ("ram_allocation", "ram_allocation"),
+    ("java_path", "java_path"),
+    ("show_fabric", "show_fabric"),
+    ("show_forge", "show_forge"),
+    ("show_snapshots", "show_snapshots"),
+)
+
+USERNAME_PATTERN = re.compile(r"[A-Za-z0-9_]{3,16}")
+INVALID_USERNAME_MESSAGE = "Usernames must be 3-16 characters long and use only letters, numbers and underscores."
+
+QUICK_PLAY_ARGS = frozenset((
+    "--quickPlayPath",
+    "--quickPlaySingleplayer",
+    "--quickPlayMultiplayer",
+    "--quickPlayRealms",
+))
+
+@lru_cache(maxsize=None)
+def get_http_session():
+    import requests
+    from requests.adapters import HTTPAdapter
+    
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=2))
+    return session
+
+class ImageLoadThread(QThread):
+    image_signal = pyqtSignal(str, QImage)
+    
+    def __init__(self, images, cache_dir):
+        super().__init__()
+        self.images = images
+        self.cache_dir = cache_dir
+    
+    def run(self):
+        # QImage can be decoded off the GUI thread; QPixmap conversion happens in the slot
+        for key, path, width, height in self.images:
+            # Ölçeklenmiş kopya diskte tutulur, kaynak değişmedikçe tekrar ölçeklenmez
+            name = os.path.splitext(os.path.basename(path))[0]
+            # Sonek scale_image ile aynı kurala uyar: creeper_26x26_..., header_h40_...
+            if width and height:
+                size = f"{width}x{height}"
+            elif height:
+                size = f"h{height}"
+            else:
+                size = "full"
+            # Kaynağın mtime/boyutu dosya adında: kaynak değişince (eski bir yedekle
+            # geri yüklense bile) ad değişir, tarih karşılaştırmasına gerek kalmaz
+            try:
+                source_stat = os.stat(path)
+            except OSError:
+                continue
+            scaled_path = os.path.join(
+                self.cache_dir,
+                f"{name}_{size}_{source_stat.st_mtime_ns}_{source_stat.st_size}.png"
+            )
+            image = QImage(scaled_path) if os.path.exists(scaled_path) else QImage()
+            use_scaled = not image.isNull()
+            if not use_scaled:
+                image = QImage(path)
+                if image.isNull():
+                    continue
+            
+            if not use_scaled:
+                image = scale_image(image, width, height)
+                try:
+                    os.makedirs(self.cache_dir, exist_ok=True)
+                    # Yarım yazılmış bir PNG önbellekte kalmasın
+                    temp_path = scaled_path + ".tmp"
+                    if image.save(temp_path, "PNG"):
+                        os.replace(temp_path, scaled_path)
+                    else:
+                        logger.debug("Could not write scaled image %s", scaled_path)
+                except Exception:
+                    logger.debug("Could not write scaled image %s", scaled_path, exc_info=True)
+            
+            self.image_signal.emit(key, image)
 
 class MinecraftVersionThread(QThread):
     version_signal = pyqtSignal(list)
     
-    def run(self):
+    def __init__(self, cache_path, forge_cache, show_snapshots, show_fabric, show_forge):
+        super().__init__()
+        self.cache_path = cache_path
+        self.forge_cache = forge_cache
+        self.show_snapshots = show_snapshots
+        self.show_fabric = show_fabric
+        self.show_forge = show_forge
+    
+    def forge_probe_needed(self, vanilla_ids):
+        # Liste eskiyse ya da henüz bilinmeyen bir sürüm varsa
+        if time.time() - self.forge_cache["fetched_at"] >= FORGE_CACHE_MAX_AGE:
+            return True
+        known_versions = self.forge_cache["versions"]
+        return any(vanilla_id not in known_versions for vanilla_id in vanilla_ids)
+    
+    def find_forge_versions(self, vanilla_ids):
+        # find_forge_version downloads the whole Forge list on every call;
+        # fetch it once and take the first (latest) build for each version
+        latest_forge = {}
         try:
-            versions = mclib.utils.get_version_list()
-            self.version_signal.emit(versions)
-        except Exception as e:
-            self.version_signal.emit([])
+            import minecraft_launcher_lib.forge as forge
+            
+            for forge_version in forge.list_forge_versions():
+                latest_forge.setdefault(forge_version.split("-")[0], forge_version)
+        except Exception:
+            # Forge is optional: any failure (network, XML, mclib) keeps the old entries
+            # and leaves fetched_at alone, so the list still shows and the next start retries
+            logger.debug("Forge version lookup failed", exc_info=True)
+            return
+        
+        # Superseded by a newer load_versions; don't overwrite its results
+        if self.isInterruptionRequested():
+            return
+        
+        # Every release is re-resolved, so known ids move to the current latest build.
+        # Swap in a new dict so save_forge_cache never sees a half-updated one.
+        forge_versions = dict(self.forge_cache["versions"])
+        forge_versions.update({vanilla_id: latest_forge.get(vanilla_id) for vanilla_id in vanilla_ids})
+        self.forge_cache["versions"] = forge_versions
+        self.forge_cache["fetched_at"] = time.time()
+    
+    def build_version_list(self, versions):
+        show_snapshots = self.show_snapshots
+        show_fabric = self.show_fabric
+        show_forge = self.show_forge
+        
+        release_versions = []
+        snapshot_versions = []
+        processed_versions = []
+        add_version = processed_versions.append
+        
+        for version in versions:
+            version_type = version.get("type")
+            if version_type == "release":
+                release_versions.append(version)
+            elif version_type == "snapshot" and show_snapshots:
+                snapshot_versions.append(version)
+        
+        release_versions.sort(key=lambda x: x.get("releaseTime", ""), reverse=True)
+        snapshot_versions.sort(key=lambda x: x.get("releaseTime", ""), reverse=True)
+
+        combined_versions = snapshot_versions + release_versions
+
+        forge_versions = self.forge_cache["versions"]
+
+        for version in combined_versions:
+            vanilla_id = version.get("id")
+            if not vanilla_id: continue
+            
+            is_release = version.get("type") == "release"
+            display_name_prefix = "" if is_release else "[S] "
+
+            add_version((f"{display_name_prefix}{vanilla_id}", vanilla_id, "vanilla"))
+
+            if show_fabric and is_release: 
+                fabric_display_name = f"Fabric {vanilla_id}"
+                add_version((fabric_display_name, vanilla_id, "fabric"))
+
+            if show_forge and is_release:
+                forge_version_str = forge_versions.get(vanilla_id)
+                if forge_version_str:
+                    forge_display_name = f"Forge {vanilla_id}"
+                    add_version((forge_display_name, vanilla_id, "forge", forge_version_str))
+        
+        return processed_versions
+    
+    def load_cache(self):
+        try:
+            with open(self.cache_path, 'r') as f:
+                cache = json.load(f)
+            if cache.get("versions"):
+                return cache
+        except Exception:
+            pass
+        return None
+    
+    def save_cache(self, etag, versions):
+        try:
+            temp_path = self.cache_path + ".tmp"
+            with open(temp_path, 'w') as f:
+                json.dump({"etag": etag, "fetched_at": time.time(), "versions": versions}, f)
+            os.replace(temp_path, self.cache_path)
+        except Exception:
+            pass
+    
+    def fetch_versions(self, cache):
+        # Returns the manifest's versions, the cached ones on 304/failure, or None
+        headers = {}
+        if cache and cache.get("etag"):
+            headers["If-None-Match"] = cache["etag"]
+        
+        try:
+            response = get_http_session().get(VERSION_MANIFEST_URL, headers=headers, timeout=10)
+            if response.status_code == 304:
+                self.save_cache(cache["etag"], cache["versions"])
+                return cache["versions"]
+            response.raise_for_status()
+            
+            versions = [
+                {"id": v["id"], "type": v["type"], "releaseTime": v["releaseTime"]}
+                for v in response.json()["versions"]
+            ]
+            self.save_cache(response.headers.get("ETag"), versions)
+            return versions
+        except Exception:
+            return cache["versions"] if cache else None
+    
+    def run(self):
+        # Show the cached list right away (no network), then re-emit only if
+        # the manifest or the Forge builds changed
+        cache = self.load_cache()
+        versions = cache["versions"] if cache else None
+        emitted_versions = None
+        if versions:
+            emitted_versions = self.build_version_list(versions)
+            self.version_signal.emit(emitted_versions)
+        
+        # Pencere kapanıyorsa ağa hiç çıkma; liste tazeyse manifest istenmez
+        if self.isInterruptionRequested():
+            return
+        if not cache or time.time() - cache.get("fetched_at", 0) >= VERSION_CACHE_MAX_AGE:
+            versions = self.fetch_versions(cache)
+            if versions is None:
+                if not self.isInterruptionRequested():
+                    self.version_signal.emit([])
+                return
+        
+        if self.show_forge and not self.isInterruptionRequested():
+            release_ids = [v.get("id") for v in versions if v.get("type") == "release" and v.get("id")]
+            if self.forge_probe_needed(release_ids):
+                self.find_forge_versions(release_ids)
+        
+        if self.isInterruptionRequested():
+            return
+        processed_versions = self.build_version_list(versions)
+        if processed_versions != emitted_versions:
+            self.version_signal.emit(processed_versions)
 
 class MinecraftInstallThread(QThread):
-    progress_signal = pyqtSignal(int, str)
     complete_signal = pyqtSignal(bool, str)
     
-    def __init__(self, minecraft_dir, version, version_type, forge_version_string=None):
+    def __init__(self, minecraft_dir, version, version_type, progress_queue, forge_version_string=None):
         super().__init__()
+        self.progress_queue = progress_queue
         self.minecraft_directory = minecraft_dir
         self.version = version
         self.version_type = version_type
         self.forge_version_string = forge_version_string
         self._current_status = "Starting installation..."
         self._current_progress = 0
+        self._last_emit = 0.0
+        self._last_emit_progress = 0
+        self._progress_scale = 0.0
         
     def set_status(self, status):
+        if status == self._current_status:
+            return
         self._current_status = status
-        self.progress_signal.emit(self._current_progress, self._current_status)
+        self._last_emit = time.monotonic()
+        self.progress_queue.put((self._current_progress, self._current_status))
+
+    def set_max(self, max_value):
+        # mclib sets the total once per phase, then reports only the current value
+        self._progress_scale = 100.0 / max_value if max_value > 0 else 0.0
 
-    def set_progress(self, value, max_value=None):
-        if max_value is not None and max_value > 0: 
-            self._current_progress = int((value / max_value) * 100)
+    def set_progress(self, value):
+        self._current_progress = min(int(value * self._progress_scale), 100)
         
-        self.progress_signal.emit(self._current_progress, self._current_status)
+        # mclib reports every file; cap UI updates at ~30 per second and skip repeats
+        if self._current_progress == self._last_emit_progress:
+            return
+        now = time.monotonic()
+        if now - self._last_emit < 0.033 and self._current_progress < 100:
+            return
+        self._last_emit = now
+        self._last_emit_progress = self._current_progress
+        self.progress_queue.put((self._current_progress, self._current_status))
         
     def run(self):
+        import minecraft_launcher_lib as mclib
+        import minecraft_launcher_lib.forge as forge
+        
         callback_dict = {
             "setStatus": self.set_status,
-            "setProgress": self.set_progress
+            "setProgress": self.set_progress,
+            "setMax": self.set_max
         }
         
         base_vanilla_id = self.version
@@ -84,8 +447,7 @@ class MinecraftInstallThread(QThread):
 
         try:
             self.set_status(f"Installing Vanilla {base_vanilla_id}...")
-            if not os.path.exists(self.minecraft_directory):
-                os.makedirs(self.minecraft_directory)
+            os.makedirs(self.minecraft_directory, exist_ok=True)
                 
             mclib.install.install_minecraft_version(
                 base_vanilla_id, 
@@ -141,11 +503,77 @@ class MinecraftInstallThread(QThread):
             error_message = f"Error installing {self.version}: {str(e)}"
             self.complete_signal.emit(False, error_message)
 
+class OpenDirectoryThread(QThread):
+    error_signal = pyqtSignal(str)
+    
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+    
+    def run(self):
+        try:
+            if sys.platform == 'win32':
+                os.startfile(self.path)
+            elif sys.platform == 'darwin':
+                subprocess.Popen(['open', self.path])
+            else:
+                subprocess.Popen(['xdg-open', self.path])
+        except Exception as e:
+            self.error_signal.emit(str(e))
+
+def version_json_mtimes(minecraft_directory, version):
+    # Fabric/Forge sürümleri inheritsFrom ile vanilla JSON'unu da okur; zincirdeki
+    # herhangi bir JSON değişirse komut yeniden oluşturulmalı
+    mtimes = []
+    seen = set()
+    while version and version not in seen:
+        seen.add(version)
+        version_json = os.path.join(minecraft_directory, "versions", version, f"{version}.json")
+        try:
+            mtimes.append(os.stat(version_json).st_mtime_ns)
+            with open(version_json, 'r') as f:
+                version = json.load(f).get("inheritsFrom")
+        except (OSError, ValueError, AttributeError):
+            mtimes.append(None)
+            break
+    return tuple(mtimes)
+
+@lru_cache(maxsize=8)
+def build_minecraft_command(version, minecraft_directory, username, ram, java_path, version_mtimes):
+    import minecraft_launcher_lib as mclib
+    
+    options = {
+        "username": username,
+        "uuid": generate_uuid_from_username(username),
+        "token": "",
+        "jvmArguments": [f"-Xmx{ram}m"],
+        "quickPlayPath": None
+    }
+    
+    if java_path:
+        options["executablePath"] = java_path
+    
+    command = mclib.command.get_minecraft_command(version, minecraft_directory, options)
+    
+    # Each QuickPlay flag appears at most once, followed by its value
+    filtered_command = list(command)
+    for flag in QUICK_PLAY_ARGS:
+        try:
+            flag_index = filtered_command.index(flag)
+        except ValueError:
+            continue
+        del filtered_command[flag_index:flag_index + 2]
+    
+    return tuple(filtered_command)
+
 class MinecraftLauncherThread(QThread):
     launch_signal = pyqtSignal(bool, str)
     
     def __init__(self, minecraft_dir, version, username, ram, java_path=None):
         super().__init__()
+        self.configure(minecraft_dir, version, username, ram, java_path)
+    
+    def configure(self, minecraft_dir, version, username, ram, java_path=None):
         self.minecraft_directory = minecraft_dir
         self.version = version
         self.username = username
@@ -158,38 +586,15 @@ class MinecraftLauncherThread(QThread):
                 java_path = self.java_path
             else:
                 java_path = None
-                
-            player_uuid = generate_uuid_from_username(self.username)
-                
-            options = {
-                "username": self.username,
-                "uuid": player_uuid,
-                "token": "",
-                "jvmArguments": [f"-Xmx{self.ram}m"],
-                "quickPlayPath": None
-            }
-            
-            if java_path:
-                options["executablePath"] = java_path
-            
-            command = mclib.command.get_minecraft_command(
-                self.version, 
-                self.minecraft_directory, 
-                options
-            )
             
-            filtered_command = []
-            skip_next = False
-            for i, arg in enumerate(command):
-                if skip_next:
-                    skip_next = False
-                    continue
-                    
-                if arg == "--quickPlayPath" or arg.startswith("--quickPlay"):
-                    skip_next = True
-                    continue
-                    
-                filtered_command.append(arg)
+            filtered_command = list(build_minecraft_command(
+                self.version,
+                self.minecraft_directory,
+                self.username,
+                self.ram,
+                java_path,
+                version_json_mtimes(self.minecraft_directory, self.version)
+            ))
             
             startupinfo = None
             if os.name == 'nt':
@@ -202,7 +607,9 @@ class MinecraftLauncherThread(QThread):
                     filtered_command, 
                     cwd=self.minecraft_directory,
                     startupinfo=startupinfo,
-                    creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+                    creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0,
+                    # POSIX: launcher holds no fds the game shouldn't see; skip the close-all pass
+                    close_fds=os.name == 'nt'
                 )
                 self.launch_signal.emit(True, "Minecraft launch command sent successfully.")
             except Exception as e:
@@ -219,42 +626,8 @@ class UserInfoDialog(QDialog):
         self.setWindowTitle("Welcome to Nova Launcher")
         self.setMinimumSize(460, 260)
         self.setMaximumSize(460, 260)
+        self.setObjectName("userInfoDialog")
         self.setup_ui()
-        
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2d2d2d;
-                color: #e0e0e0;
-            }
-            QLabel {
-                color: #e0e0e0;
-            }
-            QLineEdit {
-                background-color: #3d3d3d;
-                color: #e0e0e0;
-                border: 1px solid #5d5d5d;
-                padding: 8px;
-                border-radius: 4px;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #5ba042;
-            }
-            QPushButton {
-                background-color: #5ba042;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #4e8a38;
-            }
-            QPushButton:pressed {
-                background-color: #3d6b2c;
-            }
-        """)
     
     def setup_ui(self):
         layout = QVBoxLayout()
@@ -290,8 +663,8 @@ class UserInfoDialog(QDialog):
     
     def accept_username(self):
         username = self.username_input.text().strip()
-        if not username:
-            QMessageBox.warning(self, "Invalid Input", "Please enter a valid username.")
+        if not USERNAME_PATTERN.fullmatch(username):
+            QMessageBox.warning(self, "Invalid Input", INVALID_USERNAME_MESSAGE)
             return
         
         self.username = username
@@ -309,108 +682,12 @@ class SettingsDialog(QDialog):
         self.dragging = False
         self.offset = None
         
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2d2d2d;
-                color: #e0e0e0;
-            }
-            #titleBar {
-                background-color: #1e1e1e;
-            }
-            QTabWidget::pane { 
-                border: 1px solid #3d3d3d;
-                background-color: #2d2d2d;
-                border-radius: 4px;
-            }
-            QTabBar::tab {
-                background-color: #3d3d3d;
-                color: #e0e0e0;
-                padding: 8px 16px;
-                border: 1px solid #4d4d4d;
-                border-bottom: none;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected {
-                background-color: #4d4d4d;
-                color: #ffffff;
-            }
-            QLabel {
-                color: #e0e0e0;
-            }
-            QComboBox, QSpinBox {
-                background-color: #3d3d3d;
-                color: #e0e0e0;
-                border: 1px solid #5d5d5d;
-                padding: 4px;
-                border-radius: 4px;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QSlider::groove:horizontal {
-                border: 1px solid #5d5d5d;
-                height: 8px;
-                background: #3d3d3d;
-                margin: 2px 0;
-                border-radius: 4px;
-            }
-            QSlider::handle:horizontal {
-                background: #5ba042;
-                border: 1px solid #5ba042;
-                width: 18px;
-                margin: -8px 0;
-                border-radius: 9px;
-            }
-            QPushButton {
-                background-color: #5ba042;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-            }
-            QPushButton:hover {
-                background-color: #4e8a38;
-            }
-            QPushButton:pressed {
-                background-color: #3d6b2c;
-            }
-            QPushButton#cancelButton {
-                background-color: #3d3d3d;
-                color: #e0e0e0;
-                border: 1px solid #5d5d5d;
-            }
-            QPushButton#cancelButton:hover {
-                background-color: #4d4d4d;
-            }
-            QPushButton#minimizeBtn, QPushButton#closeBtn {
-                background-color: transparent;
-                color: #dddddd;
-                border: none;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 0px;
-                margin: 0px;
-                border-radius: 0px;
-            }
-            QPushButton#minimizeBtn:hover {
-                background-color: #3d3d3d;
-                color: #ffffff;
-            }
-            QPushButton#closeBtn:hover {
-                background-color: #c42b1c;
-                color: #ffffff;
-            }
-            QCheckBox {
-                color: #e0e0e0;
-            }
-        """)
+        self.setObjectName("settingsDialog")
         
         self.setup_ui()
         
-        if os.path.exists(LOGO_PATH):
-            self.setWindowIcon(QIcon(LOGO_PATH))
+        if LOGO_EXISTS:
+            self.setWindowIcon(get_logo_icon())
     
     def setup_ui(self):
         main_widget = QWidget()
@@ -431,14 +708,13 @@ class SettingsDialog(QDialog):
         
         # Logo ve başlık
         logo_label = QLabel()
+        logo_label.setObjectName("titleLogo")
         logo_label.setFixedSize(20, 20)
-        logo_label.setStyleSheet("background-color: #1e1e1e;")
-        if os.path.exists(LOGO_PATH):
-            logo_pixmap = QPixmap(LOGO_PATH)
-            logo_label.setPixmap(logo_pixmap.scaled(20, 20, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        if LOGO_EXISTS:
+            logo_label.setPixmap(get_title_logo_pixmap())
         
         title_label = QLabel("Settings")
-        title_label.setStyleSheet("background-color: #1e1e1e; color: #e0e0e0; font-weight: bold;")
+        title_label.setObjectName("titleText")
         
         # Window control butonları
         minimize_btn = QPushButton("―")
@@ -446,44 +722,12 @@ class SettingsDialog(QDialog):
         minimize_btn.setFixedSize(45, 35)
         minimize_btn.setFont(QFont("Arial", 12, QFont.Bold))
         minimize_btn.clicked.connect(self.showMinimized)
-        minimize_btn.setStyleSheet("""
-            QPushButton#minimizeBtn {
-                background-color: transparent;
-                color: #dddddd;
-                border: none;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 0px;
-                margin: 0px;
-                border-radius: 0px;
-            }
-            QPushButton#minimizeBtn:hover {
-                background-color: #3d3d3d;
-                color: #ffffff;
-            }
-        """)
         
         close_btn = QPushButton("×")
         close_btn.setObjectName("closeBtn")
         close_btn.setFixedSize(45, 35)
         close_btn.setFont(QFont("Arial", 14, QFont.Bold))
         close_btn.clicked.connect(self.reject)
-        close_btn.setStyleSheet("""
-            QPushButton#closeBtn {
-                background-color: transparent;
-                color: #dddddd;
-                border: none;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 0px;
-                margin: 0px;
-                border-radius: 0px;
-            }
-            QPushButton#closeBtn:hover {
-                background-color: #c42b1c;
-                color: #ffffff;
-            }
-        """)
         
         # Window control butonlarını tek bir widget içine koy
         window_controls = QWidget()
@@ -527,7 +771,7 @@ class SettingsDialog(QDialog):
         dir_label = QLabel("Minecraft Directory:")
         dir_label.setMinimumWidth(120)
         self.directory_label = QLabel(self.parent.minecraft_directory)
-        self.directory_label.setStyleSheet("font-size: 13px; color: #aaaaaa; background-color: #3d3d3d; padding: 5px; border-radius: 3px;")
+        self.directory_label.setObjectName("pathLabel")
         directory_button = QPushButton("Select")
         directory_button.setMaximumWidth(80)
         directory_button.clicked.connect(self.select_directory)
@@ -553,7 +797,7 @@ class SettingsDialog(QDialog):
         self.username_combo.setEditable(True)
         self.username_combo.setMinimumHeight(40)
         self.username_combo.setCurrentText(self.parent.username)
-        self.username_combo.setStyleSheet("padding: 2px 5px;")
+        self.username_combo.setObjectName("usernameCombo")
         
         username_layout.addWidget(username_label)
         username_layout.addWidget(self.username_combo)
@@ -589,7 +833,7 @@ class SettingsDialog(QDialog):
         java_label = QLabel("Java Path:")
         java_label.setMinimumWidth(120)
         self.java_path_label = QLabel(self.parent.java_path if self.parent.java_path else "System default")
-        self.java_path_label.setStyleSheet("font-size: 13px; color: #aaaaaa; background-color: #3d3d3d; padding: 5px; border-radius: 3px;")
+        self.java_path_label.setObjectName("pathLabel")
         java_path_button = QPushButton("Select")
         java_path_button.setMaximumWidth(80)
         java_path_button.clicked.connect(self.select_java_path)
@@ -624,8 +868,8 @@ class SettingsDialog(QDialog):
         self.ram_spin.setValue(self.parent.ram_allocation // 1024)
         self.ram_spin.setSuffix(" GB")
         
-        self.ram_slider.valueChanged.connect(self.ram_spin.setValue)
-        self.ram_spin.valueChanged.connect(self.ram_slider.setValue)
+        self.ram_slider.valueChanged.connect(lambda value: self.sync_ram(self.ram_spin, value))
+        self.ram_spin.valueChanged.connect(lambda value: self.sync_ram(self.ram_slider, value))
         
         ram_layout.addWidget(ram_label)
         ram_layout.addWidget(self.ram_slider)
@@ -659,6 +903,22 @@ class SettingsDialog(QDialog):
         content_layout.addWidget(tab_widget)
         content_layout.addWidget(button_widget)
     
+    def refresh_from_parent(self):
+        # Diyalog yeniden kullanıldığında alanları güncel ayarlarla doldur
+        self.directory_label.setText(self.parent.minecraft_directory)
+        self.username_combo.setCurrentText(self.parent.username)
+        self.fabric_checkbox.setChecked(self.parent.show_fabric)
+        self.forge_checkbox.setChecked(self.parent.show_forge)
+        self.snapshot_checkbox.setChecked(self.parent.show_snapshots)
+        self.java_path_label.setText(self.parent.java_path if self.parent.java_path else "System default")
+        self.ram_slider.setValue(self.parent.ram_allocation // 1024)
+    
+    def sync_ram(self, other, value):
+        # Diğer kontrolü sinyal yaymadan güncelle, geri besleme döngüsünü önler
+        other.blockSignals(True)
+        other.setValue(value)
+        other.blockSignals(False)
+    
     # Pencereyi taşıma fonksiyonları
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -677,34 +937,45 @@ class SettingsDialog(QDialog):
         if event.button() == Qt.LeftButton:
             self.dragging = False
     
+    def open_file_dialog(self, file_dialog, target_label):
+        # exec_ yerine open: yerel seçici açılırken ayarlar penceresi donmaz
+        file_dialog.setAttribute(Qt.WA_DeleteOnClose)
+        file_dialog.fileSelected.connect(lambda path: path and target_label.setText(path))
+        file_dialog.open()
+    
     def select_directory(self):
-        directory = QFileDialog.getExistingDirectory(
+        file_dialog = QFileDialog(
             self, 
             "Select Minecraft Directory",
             self.parent.minecraft_directory
         )
-        
-        if directory:
-            self.directory_label.setText(directory)
+        file_dialog.setFileMode(QFileDialog.Directory)
+        file_dialog.setOption(QFileDialog.ShowDirsOnly)
+        self.open_file_dialog(file_dialog, self.directory_label)
     
     def select_java_path(self):
         file_filter = "Executable files (*.exe);;All files (*.*)" if os.name == 'nt' else "All files (*.*)"
-        java_path, _ = QFileDialog.getOpenFileName(
+        file_dialog = QFileDialog(
             self, 
             "Select Java Executable",
             os.path.dirname(self.parent.java_path) if self.parent.java_path else os.path.expanduser("~"),
             file_filter
         )
-        
-        if java_path:
-            self.java_path_label.setText(java_path)
+        file_dialog.setFileMode(QFileDialog.ExistingFile)
+        self.open_file_dialog(file_dialog, self.java_path_label)
     
     def reset_java_path(self):
         self.java_path_label.setText("System default")
     
     def save_settings(self):
+        # Combo düzenlenebilir; UserInfoDialog ile aynı kural uygulanır
+        username = self.username_combo.currentText().strip()
+        if not USERNAME_PATTERN.fullmatch(username):
+            QMessageBox.warning(self, "Invalid Input", INVALID_USERNAME_MESSAGE)
+            return
+        
         self.parent.minecraft_directory = self.directory_label.text()
-        self.parent.username = self.username_combo.currentText()
+        self.parent.username = username
         
         java_path_text = self.java_path_label.text()
         if java_path_text == "System default":
@@ -735,17 +1006,16 @@ class NovaLauncher(QMainWindow):
             
         self.settings_file_path = os.path.join(self._install_dir, "nova_launcher_settings.json") 
         
+        # Diskteki son içerik; aynıysa dosya yeniden yazılmaz
+        self.saved_settings_data = None
         self.settings = self.load_settings()
         
-        self.minecraft_directory = self.settings.get("minecraft_directory", DEFAULT_MINECRAFT_DIR)
-        self.username = self.settings.get("username", "")
-        self.selected_version = self.settings.get("last_used_version")
-        self.selected_version_type = self.settings.get("last_version_type")
-        self.ram_allocation = self.settings.get("ram_allocation", DEFAULT_SETTINGS["ram_allocation"])
-        self.java_path = self.settings.get("java_path", DEFAULT_SETTINGS["java_path"])
-        self.show_fabric = self.settings.get("show_fabric", DEFAULT_SETTINGS["show_fabric"])
-        self.show_forge = self.settings.get("show_forge", DEFAULT_SETTINGS["show_forge"])
-        self.show_snapshots = self.settings.get("show_snapshots", DEFAULT_SETTINGS["show_snapshots"])
+        self.forge_cache_path = os.path.join(self._install_dir, FORGE_CACHE_FILE_NAME)
+        self.forge_cache = self.load_forge_cache()
+        
+        # load_settings fills in defaults, so every key is present
+        for key, attribute in SETTINGS_ATTRIBUTES:
+            setattr(self, attribute, self.settings[key])
         
         if not self.username:
             dialog = UserInfoDialog(self)
@@ -761,134 +1031,50 @@ class NovaLauncher(QMainWindow):
         # Kenarlığı kaldır, frameless pencere yap
         self.setWindowFlags(Qt.FramelessWindowHint)
         
-        if os.path.exists(LOGO_PATH):
-            self.setWindowIcon(QIcon(LOGO_PATH))
-        
-        self.setup_dark_theme()
+        if LOGO_EXISTS:
+            self.setWindowIcon(get_logo_icon())
         
         self.setup_ui()
         
+        images = []
+        if AVATAR_EXISTS:
+            images.append((self.avatar_label, AVATAR_PATH, 26, 26))
+        if HEADER_EXISTS:
+            images.append((self.header_label, HEADER_PATH, None, 40))
+        self.load_images(images)
+        
         self.version_retries = 0
         self.max_retries = 5
         
-        self.launch_hide_timer = None
-        
-        self.load_versions()
-        
-        if not os.path.exists(self.minecraft_directory):
-            try:
-                os.makedirs(self.minecraft_directory)
-            except Exception as e:
-                print(f"Could not create Minecraft directory: {str(e)}")
+        self.launch_hide_timer = QTimer(self)
+        self.launch_hide_timer.setSingleShot(True)
+        self.launch_hide_timer.timeout.connect(self.hide_loading)
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.timeout.connect(self.save_settings)
+        self.settings_dialog = None
+        self.open_directory_thread = None
+        self.launch_error_box = None
+        self.version_thread = None
+        self.retired_version_threads = set()
+        self.launch_thread = None
+        self.closing = False
+        self.versions_index_key = None
+        self.versions_index = {}
+        
+        # Install thread pushes progress here; the GUI only applies the latest entry
+        self.install_progress_queue = queue.SimpleQueue()
+        self.install_progress_timer = QTimer(self)
+        self.install_progress_timer.setInterval(50)
+        self.install_progress_timer.timeout.connect(self.drain_install_progress)
+        
+        # Pencere ilk kez çizildikten sonra başlasın
+        QTimer.singleShot(0, self.post_init)
                 
         # Pencere taşıma için gereken değişkenler
         self.dragging = False
         self.offset = None
     
-    def setup_dark_theme(self):
-        self.setStyleSheet("""
-            QMainWindow, QWidget {
-                background-color: #2d2d2d;
-                color: #e0e0e0;
-            }
-            #titleBar {
-                background-color: #1e1e1e;
-            }
-            #contentWidget {
-                background-color: #2d2d2d;
-            }
-            QGroupBox {
-                border: 1px solid #3d3d3d;
-                border-radius: 5px;
-                margin-top: 10px;
-                font-weight: bold;
-                color: #e0e0e0;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QLabel {
-                color: #e0e0e0;
-            }
-            QLabel#titleLabel {
-                color: #5ba042;
-                font-weight: bold;
-            }
-            QComboBox {
-                background-color: #3d3d3d;
-                color: #e0e0e0;
-                border: 1px solid #5d5d5d;
-                padding: 4px;
-                border-radius: 4px;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QLineEdit {
-                background-color: #3d3d3d;
-                color: #e0e0e0;
-                border: 1px solid #5d5d5d;
-                padding: 4px;
-                border-radius: 4px;
-            }
-            QPushButton {
-                background-color: #3d3d3d;
-                color: #e0e0e0;
-                border: 1px solid #5d5d5d;
-                border-radius: 4px;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-            QPushButton:pressed {
-                background-color: #2d2d2d;
-            }
-            QPushButton#playButton {
-                background-color: #5ba042;
-                color: white;
-                border: none;
-                font-weight: bold;
-                font-size: 16px;
-            }
-            QPushButton#playButton:hover {
-                background-color: #4e8a38;
-            }
-            QPushButton#playButton:pressed {
-                background-color: #3d6b2c;
-            }
-            QPushButton#minimizeBtn, QPushButton#closeBtn {
-                background-color: transparent;
-                color: #dddddd;
-                border: none;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 0px;
-                margin: 0px;
-                border-radius: 0px;
-            }
-            QPushButton#minimizeBtn:hover {
-                background-color: #3d3d3d;
-                color: #ffffff;
-            }
-            QPushButton#closeBtn:hover {
-                background-color: #c42b1c;
-                color: #ffffff;
-            }
-            QProgressBar {
-                border: 1px solid #5d5d5d;
-                border-radius: 4px;
-                text-align: center;
-                background-color: #3d3d3d;
-            }
-            QProgressBar::chunk {
-                background-color: #5ba042;
-                width: 20px;
-            }
-        """)
-
     def setup_ui(self):
         main_widget = QWidget()
         main_layout = QVBoxLayout()
@@ -909,13 +1095,13 @@ class NovaLauncher(QMainWindow):
         
         # Logo ve başlık
         logo_label = QLabel()
+        logo_label.setObjectName("titleLogo")
         logo_label.setFixedSize(20, 20)
-        if os.path.exists(LOGO_PATH):
-            logo_pixmap = QPixmap(LOGO_PATH)
-            logo_label.setPixmap(logo_pixmap.scaled(20, 20, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        if LOGO_EXISTS:
+            logo_label.setPixmap(get_title_logo_pixmap())
         
         title_label = QLabel(APP_NAME)
-        title_label.setStyleSheet("color: #e0e0e0; font-weight: bold;")
+        title_label.setObjectName("titleText")
         
         # Window control butonları
         minimize_btn = QPushButton("―")
@@ -923,47 +1109,16 @@ class NovaLauncher(QMainWindow):
         minimize_btn.setFixedSize(45, 35)
         minimize_btn.setFont(QFont("Arial", 12, QFont.Bold))
         minimize_btn.clicked.connect(self.showMinimized)
-        minimize_btn.setStyleSheet("""
-            QPushButton#minimizeBtn {
-                background-color: transparent;
-                color: #dddddd;
-                border: none;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 0px;
-                margin: 0px;
-                border-radius: 0px;
-            }
-            QPushButton#minimizeBtn:hover {
-                background-color: #3d3d3d;
-                color: #ffffff;
-            }
-        """)
         
         close_btn = QPushButton("×")
         close_btn.setObjectName("closeBtn")
         close_btn.setFixedSize(45, 35)
         close_btn.setFont(QFont("Arial", 14, QFont.Bold))
         close_btn.clicked.connect(self.close)
-        close_btn.setStyleSheet("""
-            QPushButton#closeBtn {
-                background-color: transparent;
-                color: #dddddd;
-                border: none;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 0px;
-                margin: 0px;
-                border-radius: 0px;
-            }
-            QPushButton#closeBtn:hover {
-                background-color: #c42b1c;
-                color: #ffffff;
-            }
-        """)
         
         # Window control butonlarını tek bir widget içine koy
         window_controls = QWidget()
+        window_controls.setObjectName("windowControls")
         window_controls_layout = QHBoxLayout()
         window_controls_layout.setContentsMargins(0, 0, 0, 0)
         window_controls_layout.setSpacing(0)
@@ -974,13 +1129,10 @@ class NovaLauncher(QMainWindow):
         
         # Title bar düzeni
         title_layout.addWidget(logo_label)
-        logo_label.setStyleSheet("background-color: #1e1e1e;")
         title_layout.addSpacing(5)
         title_layout.addWidget(title_label)
-        title_label.setStyleSheet("background-color: #1e1e1e;")
         title_layout.addStretch()
         title_layout.addWidget(window_controls)
-        window_controls.setStyleSheet("background-color: #1e1e1e;")
         
         # Ana içerik alanı
         content_widget = QWidget()
@@ -1004,13 +1156,6 @@ class NovaLauncher(QMainWindow):
         user_widget = QWidget()
         user_widget.setObjectName("userWidget")
         user_widget.setMaximumWidth(200)
-        user_widget.setStyleSheet("""
-            #userWidget {
-                background-color: #2d2d2d;
-                border-radius: 4px;
-                padding: 0px;
-            }
-        """)
         user_layout = QHBoxLayout()
         user_layout.setContentsMargins(8, 4, 10, 4)
         user_layout.setSpacing(8)
@@ -1019,35 +1164,11 @@ class NovaLauncher(QMainWindow):
         self.avatar_label = QLabel()
         self.avatar_label.setFixedSize(26, 26)
         
-        creeper_path = os.path.join(RESOURCES_DIR, "creeper.jpg")
-        if os.path.exists(creeper_path):
-            avatar_pixmap = QPixmap(creeper_path)
-            self.avatar_label.setPixmap(avatar_pixmap.scaled(26, 26, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-        else:
-            avatar_pixmap = QPixmap(26, 26)
-            avatar_pixmap.fill(Qt.transparent)
-            painter = QPainter(avatar_pixmap)
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setBrush(QColor(PRIMARY_COLOR))
-            painter.setPen(Qt.NoPen)
-            painter.drawEllipse(0, 0, 26, 26)
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(QColor(255, 255, 255))
-            painter.drawEllipse(9, 4, 8, 8)
-            path = QPainterPath()
-            path.moveTo(13, 12)
-            path.lineTo(17, 22)
-            path.lineTo(9, 22)
-            path.lineTo(13, 12)
-            painter.drawPath(path)
-            painter.end()
-            self.avatar_label.setPixmap(avatar_pixmap)
+        if not AVATAR_EXISTS:
+            self.avatar_label.setPixmap(get_default_avatar_pixmap())
         
         self.user_label = QLabel(self.username)
-        self.user_label.setStyleSheet("""
-            color: #e0e0e0;
-            font-size: 13px;
-        """)
+        self.user_label.setObjectName("userLabel")
         
         user_layout.addWidget(self.avatar_label)
         user_layout.addWidget(self.user_label)
@@ -1055,11 +1176,8 @@ class NovaLauncher(QMainWindow):
         
         self.header_label = QLabel()
         self.header_label.setAlignment(Qt.AlignCenter)
-        header_path = os.path.join(RESOURCES_DIR, "header.png")
-        if os.path.exists(header_path):
-            header_pixmap = QPixmap(header_path)
-            header_pixmap = header_pixmap.scaledToHeight(40, Qt.SmoothTransformation)
-            self.header_label.setPixmap(header_pixmap)
+        if HEADER_EXISTS:
+            self.header_label.setMinimumHeight(40)
         else:
             self.header_label.setText(APP_NAME)
             self.header_label.setObjectName("titleLabel")
@@ -1070,21 +1188,6 @@ class NovaLauncher(QMainWindow):
         settings_button.setObjectName("settingsButton")
         settings_button.setFixedSize(36, 36)
         settings_button.setFont(QFont("Segoe UI", 16))
-        settings_button.setStyleSheet("""
-            #settingsButton {
-                background-color: transparent;
-                border: none;
-                border-radius: 18px;
-                padding: 0px;
-                color: #e0e0e0;
-            }
-            #settingsButton:hover {
-                background-color: #3d3d3d;
-            }
-            #settingsButton:pressed {
-                background-color: #2d2d2d;
-            }
-        """)
         
         settings_button.setToolTip("Settings")
         settings_button.clicked.connect(self.open_settings)
@@ -1100,7 +1203,7 @@ class NovaLauncher(QMainWindow):
         separator = QFrame()
         separator.setFrameShape(QFrame.HLine)
         separator.setFrameShadow(QFrame.Sunken)
-        separator.setStyleSheet("background-color: #3d3d3d;")
+        separator.setObjectName("headerSeparator")
         content_layout.addWidget(separator)
         
         version_group = QGroupBox("Minecraft Version")
@@ -1123,17 +1226,8 @@ class NovaLauncher(QMainWindow):
         self.play_button.setMinimumWidth(250)
         self.play_button.setFont(QFont("Segoe UI", 16, QFont.Bold))
         
-        content_layout.addWidget(self.play_button, 0, Qt.AlignCenter)
-        
         self.loading_container = QFrame()
         self.loading_container.setObjectName("loadingContainer")
-        self.loading_container.setStyleSheet("""
-            #loadingContainer {
-                background-color: #2d2d2d;
-                border-radius: 6px;
-                border: 1px solid #5ba042;
-            }
-        """)
         self.loading_container.setFixedHeight(50)
         self.loading_container.setFixedWidth(250)
         
@@ -1147,18 +1241,25 @@ class NovaLauncher(QMainWindow):
         
         self.status_label = QLabel()
         self.status_label.setFont(QFont("Segoe UI", 8, QFont.Bold))
-        self.status_label.setStyleSheet("color: #5ba042;")
+        self.status_label.setObjectName("statusLabel")
         self.status_label.setAlignment(Qt.AlignCenter)
         
         loading_layout.addWidget(self.spinner_label)
         loading_layout.addWidget(self.status_label, 1)
         
         self.loading_container.setLayout(loading_layout)
-        self.loading_container.hide()
         
-        content_layout.addWidget(self.loading_container, 0, Qt.AlignCenter)
+        # Play butonu ve yükleme göstergesi aynı yerde; sayfa değiştirmek yeterli
+        self.play_stack = QStackedWidget()
+        self.play_stack.addWidget(self.play_button)
+        self.play_stack.addWidget(self.loading_container)
+        
+        content_layout.addWidget(self.play_stack, 0, Qt.AlignCenter)
         
-        self.spinner_angle = 0
+        # Spinner 15 derecelik adımlarla döner; 24 kareyi bir kez çiz
+        for index in range(SPINNER_FRAME_COUNT):
+            get_spinner_frame(index)
+        self.spinner_index = 0
         self.spinner_timer = QTimer()
         self.spinner_timer.timeout.connect(self.update_spinner)
         
@@ -1192,10 +1293,48 @@ class NovaLauncher(QMainWindow):
             self.showMaximized()
     
     def open_settings(self):
-        settings_dialog = SettingsDialog(self)
-        settings_dialog.exec_()
+        if self.settings_dialog is None:
+            self.settings_dialog = SettingsDialog(self)
+        else:
+            self.settings_dialog.refresh_from_parent()
+        self.settings_dialog.exec_()
+    
+    def post_init(self):
+        try:
+            os.makedirs(self.minecraft_directory, exist_ok=True)
+        except Exception as e:
+            logger.warning("Could not create Minecraft directory: %s", e)
+        
+        self.load_versions()
+    
+    def load_images(self, images):
+        self.image_labels = {}
+        pending = []
+        for label, path, width, height in images:
+            key = pixmap_cache_key(path, width, height)
+            pixmap = QPixmapCache.find(key)
+            if pixmap is not None and not pixmap.isNull():
+                label.setPixmap(pixmap)
+            else:
+                self.image_labels[key] = label
+                pending.append((key, path, width, height))
+        
+        if pending:
+            self.image_thread = ImageLoadThread(pending, os.path.join(self._install_dir, IMAGE_CACHE_DIR_NAME))
+            self.image_thread.image_signal.connect(self.apply_loaded_image)
+            self.image_thread.start()
+    
+    def apply_loaded_image(self, key, image):
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pixmap)
+        label = self.image_labels.pop(key, None)
+        if label is not None:
+            label.setPixmap(pixmap)
     
     def load_versions(self):
+        if self.closing:
+            return
+        
         # Disable combobox and show loading text
         self.version_combo.setEnabled(False)
         self.version_combo.clear() # Clear previous items if any
@@ -1205,18 +1344,45 @@ class NovaLauncher(QMainWindow):
         self.progress_label.setText("Loading versions...") 
         
         # Start thread
-        self.version_thread = MinecraftVersionThread()
+        self.retire_version_thread()
+        self.version_thread = MinecraftVersionThread(
+            os.path.join(self._install_dir, VERSION_CACHE_FILE_NAME),
+            self.forge_cache,
+            self.show_snapshots,
+            self.show_fabric,
+            self.show_forge
+        )
         self.version_thread.version_signal.connect(self.update_versions)
         self.version_thread.start()
     
-    def update_versions(self, versions):
+    def retire_version_thread(self):
+        # Eski thread eski ayarlarla çalışıyor: sinyalini kes, durmasını iste ve
+        # bitene kadar referansını tut (çalışan QThread yok edilmemeli)
+        thread = self.version_thread
+        if thread is None:
+            return
+        self.version_thread = None
+        try:
+            thread.version_signal.disconnect(self.update_versions)
+        except TypeError:
+            pass
+        thread.requestInterruption()
+        if thread.isRunning():
+            self.retired_version_threads.add(thread)
+            thread.finished.connect(lambda: self.retired_version_threads.discard(thread))
+    
+    def update_versions(self, processed_versions):
+        # Kuyrukta kalmış eski bir thread sinyali listeyi ezmesin
+        if self.sender() is not self.version_thread:
+            return
+        
         current_selection = self.version_combo.currentText()
-        self.version_combo.clear()
         
-        if not versions:
-            if self.version_retries < self.max_retries:
+        if not processed_versions:
+            self.version_combo.clear()
+            if self.version_retries < self.max_retries and not self.closing:
                 self.version_retries += 1
-                print(f"Retrying version load ({self.version_retries}/{self.max_retries})...")
+                logger.info("Retrying version load (%d/%d)...", self.version_retries, self.max_retries)
                 QTimer.singleShot(3000, self.load_versions)
             return
         
@@ -1224,140 +1390,87 @@ class NovaLauncher(QMainWindow):
         self.version_combo.setPlaceholderText("Select Minecraft version")
         
         self.version_retries = 0
-        release_versions = []
-        snapshot_versions = []
-        processed_versions = []
-        
-        for version in versions:
-            version_type = version.get("type")
-            if version_type == "release":
-                release_versions.append(version)
-            elif version_type == "snapshot" and self.show_snapshots:
-                snapshot_versions.append(version)
-        
-        release_versions.sort(key=lambda x: x.get("releaseTime", ""), reverse=True)
-        snapshot_versions.sort(key=lambda x: x.get("releaseTime", ""), reverse=True)
 
-        combined_versions = snapshot_versions + release_versions
-
-        for version in combined_versions:
-            vanilla_id = version.get("id")
-            if not vanilla_id: continue
-            
-            display_name_prefix = "[S] " if version.get("type") == "snapshot" else ""
-
-            processed_versions.append((f"{display_name_prefix}{vanilla_id}", vanilla_id, "vanilla"))
-
-            if self.show_fabric and version.get("type") == "release": 
-                fabric_display_name = f"Fabric {vanilla_id}"
-                processed_versions.append((fabric_display_name, vanilla_id, "fabric"))
+        # Doldururken sinyal yok; seçim sonunda bir kez işlenir
+        self.version_combo.blockSignals(True)
+        self.version_combo.clear()
 
-            if self.show_forge and version.get("type") == "release":
-                try:
-                    forge_version_str = forge.find_forge_version(vanilla_id)
-                    if forge_version_str:
-                        forge_display_name = f"Forge {vanilla_id}"
-                        processed_versions.append((forge_display_name, vanilla_id, "forge", forge_version_str))
-                except Exception as e:
-                    pass
-
-        for item_tuple in processed_versions:
+        # Seçimi geri yüklemek için ad ve (id, tip) -> index
+        index_by_name = {}
+        index_by_version = {}
+        add_item = self.version_combo.addItem
+        for index, item_tuple in enumerate(processed_versions):
             display_name = item_tuple[0]
             version_id_or_base_id = item_tuple[1]
             version_type = item_tuple[2]
-            user_data = {"id": version_id_or_base_id, "type": version_type}
-            if version_type == "forge" and len(item_tuple) > 3:
-                user_data["forge_version"] = item_tuple[3]
+            forge_version = item_tuple[3] if version_type == "forge" and len(item_tuple) > 3 else None
+            user_data = VersionData(version_id_or_base_id, version_type, forge_version)
             
-            self.version_combo.addItem(display_name, userData=user_data)
-        
-        index = self.version_combo.findText(current_selection)
-        if index >= 0:
-            self.version_combo.setCurrentIndex(index)
-        elif not self.selected_version and self.version_combo.count() > 0:
-             self.version_combo.setCurrentIndex(0)
-             self.update_selected_version(0)
-        elif self.selected_version:
-            found_index = -1
+            add_item(display_name, userData=user_data)
+            index_by_name.setdefault(display_name, index)
+            index_by_version.setdefault((version_id_or_base_id, version_type), index)
+            # Tipi kaydedilmemiş eski ayarlar için ilk eşleşen ID (geriye dönük uyumluluk)
+            index_by_version.setdefault((version_id_or_base_id, None), index)
+        
+        index = index_by_name.get(current_selection, -1)
+        if index < 0 and self.selected_version:
             stored_id_in_settings = self.settings.get("last_used_version")
-            stored_type_in_settings = self.settings.get("last_version_type")
-            
-            for i in range(self.version_combo.count()):
-                item_data = self.version_combo.itemData(i)
-                current_item_id = item_data.get("id")
-                current_item_type = item_data.get("type")
-                
-                # Hem ID hem de tip eşleşiyorsa
-                if stored_id_in_settings == current_item_id and stored_type_in_settings == current_item_type:
-                     found_index = i
-                     break
-                # Yalnızca ID eşleşiyorsa ve tip belirtilmemişse (geriye dönük uyumluluk)
-                elif stored_id_in_settings == current_item_id and not stored_type_in_settings:
-                     found_index = i
-                     break
-
-            if found_index >= 0:
-                self.version_combo.setCurrentIndex(found_index)
-            elif self.version_combo.count() > 0:
-                 self.version_combo.setCurrentIndex(0)
-                 self.update_selected_version(0)
+            stored_type_in_settings = self.settings.get("last_version_type") or None
+            index = index_by_version.get((stored_id_in_settings, stored_type_in_settings), -1)
+
+        if index < 0:
+            index = 0
+
+        self.version_combo.setCurrentIndex(index)
+        self.version_combo.blockSignals(False)
+        self.update_selected_version(self.version_combo.currentIndex())
 
     def update_selected_version(self, index):
         if index >= 0:
             item_data = self.version_combo.itemData(index)
             if item_data:
-                self.selected_version = item_data.get("id")
-                self.selected_version_type = item_data.get("type")
-                self.save_settings()
+                version_id = item_data.id
+                version_type = item_data.type
+                if version_id == self.selected_version and version_type == self.selected_version_type:
+                    return
+                self.selected_version = version_id
+                self.selected_version_type = version_type
+                self.save_timer.start(500)
     
     def open_minecraft_directory(self):
         if not os.path.exists(self.minecraft_directory):
             QMessageBox.warning(self, "Warning", "Minecraft directory does not exist!")
             return
             
-        try:
-            if sys.platform == 'win32':
-                os.startfile(self.minecraft_directory)
-            elif sys.platform == 'darwin':
-                subprocess.Popen(['open', self.minecraft_directory])
-            else:
-                subprocess.Popen(['xdg-open', self.minecraft_directory])
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Could not open directory: {str(e)}")
+        # xdg-open/startfile can stall for a while; the previous request is still on its way
+        if self.open_directory_thread is not None and self.open_directory_thread.isRunning():
+            return
+        
+        self.open_directory_thread = OpenDirectoryThread(self.minecraft_directory)
+        self.open_directory_thread.error_signal.connect(
+            lambda message: QMessageBox.warning(self, "Error", f"Could not open directory: {message}")
+        )
+        self.open_directory_thread.start()
     
     def check_and_install_minecraft(self, version_data):
         if not version_data:
             return False
 
-        version_id = version_data.get("id")
-        version_type = version_data.get("type")
+        version_id = version_data.id
+        version_type = version_data.type
         display_name = self.version_combo.currentText()
 
         is_installed = False
-        if version_type == "fabric":
+        if version_type in ("fabric", "forge"):
             base_vanilla_id = version_id
             vanilla_version_dir = os.path.join(self.minecraft_directory, "versions", base_vanilla_id)
             vanilla_jar_file = os.path.join(vanilla_version_dir, f"{base_vanilla_id}.jar")
             
             if os.path.exists(vanilla_jar_file):
-                fabric_pattern = os.path.join(self.minecraft_directory, "versions", f"fabric-loader*-{base_vanilla_id}")
-                matching_fabric_dirs = glob.glob(fabric_pattern)
-                is_installed = bool(matching_fabric_dirs)
+                is_installed = (base_vanilla_id, version_type) in self.get_versions_index()
             else:
                  is_installed = False
 
-        elif version_type == "forge":
-            base_vanilla_id = version_id
-            vanilla_version_dir = os.path.join(self.minecraft_directory, "versions", base_vanilla_id)
-            vanilla_jar_file = os.path.join(vanilla_version_dir, f"{base_vanilla_id}.jar")
-
-            if os.path.exists(vanilla_jar_file):
-                forge_pattern = os.path.join(self.minecraft_directory, "versions", f"*{base_vanilla_id}*forge*")
-                matching_forge_dirs = glob.glob(forge_pattern)
-                is_installed = bool(matching_forge_dirs)
-            else:
-                is_installed = False
-
         else:
             version_dir = os.path.join(self.minecraft_directory, "versions", version_id)
             jar_file = os.path.join(version_dir, f"{version_id}.jar")
@@ -1381,13 +1494,42 @@ class NovaLauncher(QMainWindow):
         else:
             return False
     
+    def get_versions_index(self):
+        # (vanilla id, loader) -> installed version id; rebuilt only when versions/ changes
+        versions_dir = os.path.join(self.minecraft_directory, "versions")
+        try:
+            index_key = (versions_dir, os.stat(versions_dir).st_mtime_ns)
+        except OSError:
+            return {}
+        
+        if index_key != self.versions_index_key:
+            versions_index = {}
+            with os.scandir(versions_dir) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    name = entry.name
+                    lower_name = name.lower()
+                    if lower_name.startswith("fabric-loader-"):
+                        # fabric-loader-<loader>-<vanilla>
+                        parts = name.split("-", 3)
+                        if len(parts) == 4:
+                            versions_index.setdefault((parts[3], "fabric"), name)
+                    elif "-forge" in lower_name:
+                        # <vanilla>-forge-<forge>, eski sürümlerde <vanilla>-Forge<forge>-<vanilla>
+                        versions_index.setdefault((name[:lower_name.index("-forge")], "forge"), name)
+            self.versions_index = versions_index
+            self.versions_index_key = index_key
+        
+        return self.versions_index
+    
     def install_minecraft(self, version_data):
         if not version_data:
             QMessageBox.warning(self, "Warning", "Invalid version selected!")
             return
             
-        version_id = version_data.get("id")
-        version_type = version_data.get("type")
+        version_id = version_data.id
+        version_type = version_data.type
         display_name = self.version_combo.currentText()
 
         if not version_id or not version_type:
@@ -1396,23 +1538,27 @@ class NovaLauncher(QMainWindow):
         
         self.play_button.setText(f"INSTALLING {display_name}...")
         self.play_button.setEnabled(False)
-        self.play_button.setStyleSheet("""
-            #playButton {
-                background-color: #6c6c6c;
-                color: white;
-                border: none;
-                font-weight: bold;
-                font-size: 16px;
-                text-align: center;
-            }
-        """)
-        
-        forge_version_string = version_data.get("forge_version")
-        self.install_thread = MinecraftInstallThread(self.minecraft_directory, version_id, version_type, forge_version_string)
-        self.install_thread.progress_signal.connect(self.update_progress)
+        self.set_play_button_state("installing")
+        
+        forge_version_string = version_data.forge_version
+        self.install_thread = MinecraftInstallThread(self.minecraft_directory, version_id, version_type, self.install_progress_queue, forge_version_string)
         self.install_thread.complete_signal.connect(self.installation_complete)
+        self.install_progress_timer.start()
         self.install_thread.start()
     
+    def set_play_button_state(self, state):
+        # Stil kuralları global sayfada; sadece property değişir, sayfa yeniden parse edilmez
+        self.play_button.setProperty("state", state)
+        self.play_button.style().polish(self.play_button)
+    
+    def drain_install_progress(self):
+        latest = None
+        while not self.install_progress_queue.empty():
+            latest = self.install_progress_queue.get_nowait()
+        
+        if latest:
+            self.update_progress(*latest)
+    
     def update_play_button_text(self):
         if not self.play_button.isEnabled():
             version = self.selected_version
@@ -1446,6 +1592,8 @@ class NovaLauncher(QMainWindow):
         self.progress_label.setText(f"{status} - {percentage}%")
     
     def installation_complete(self, success, message):
+        self.install_progress_timer.stop()
+        self.drain_install_progress()
         self.progress_label.setText(message)
         
         if hasattr(self, 'play_spinner_timer') and self.play_spinner_timer.isActive():
@@ -1453,23 +1601,7 @@ class NovaLauncher(QMainWindow):
         
         self.play_button.setText("PLAY")
         self.play_button.setEnabled(True)
-        self.play_button.setStyleSheet("""
-            #playButton {
-                background-color: #5ba042;
-                color: white;
-                border: none;
-                font-weight: bold;
-                font-size: 16px;
-                text-align: center;
-                padding: 0px;
-            }
-            #playButton:hover {
-                background-color: #4e8a38;
-            }
-            #playButton:pressed {
-                background-color: #3d6b2c;
-            }
-        """)
+        self.set_play_button_state("idle")
         
         self.hide_loading()
         
@@ -1480,58 +1612,48 @@ class NovaLauncher(QMainWindow):
             QMessageBox.critical(self, "Installation Error", message)
     
     def show_loading(self, is_launching=True):
-        self.play_button.hide()
-        
         if is_launching:
             self.status_label.setText("Game will launch soon...")
-            if self.launch_hide_timer and self.launch_hide_timer.isActive():
-                self.launch_hide_timer.stop()
-            self.launch_hide_timer = QTimer(self)
-            self.launch_hide_timer.setSingleShot(True)
-            self.launch_hide_timer.timeout.connect(self.hide_loading)
             self.launch_hide_timer.start(15000)
         else:
             self.status_label.setText("Starting installation...")
         
-        self.loading_container.show()
+        self.play_stack.setCurrentWidget(self.loading_container)
         
-        self.spinner_timer.start(50)
+        self.resume_spinner()
     
     def hide_loading(self):
-        if self.launch_hide_timer and self.launch_hide_timer.isActive():
-            self.launch_hide_timer.stop()
+        self.launch_hide_timer.stop()
             
         self.spinner_timer.stop()
         
-        self.loading_container.hide()
-        
-        self.play_button.show()
+        self.play_stack.setCurrentWidget(self.play_button)
+
+    def hideEvent(self, event):
+        # Pencere görünmezken spinner'ı çizmeye gerek yok
+        self.spinner_timer.stop()
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.resume_spinner()
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.WindowStateChange:
+            # Simge durumundayken hideEvent her platformda gelmiyor
+            if self.isMinimized():
+                self.spinner_timer.stop()
+            else:
+                self.resume_spinner()
+        super().changeEvent(event)
+
+    def resume_spinner(self):
+        if self.play_stack.currentWidget() is self.loading_container and self.isVisible() and not self.isMinimized():
+            self.spinner_timer.start(50)
 
     def update_spinner(self):
-        self.spinner_angle = (self.spinner_angle + 15) % 360
-        
-        spinner_pixmap = QPixmap(30, 30)
-        spinner_pixmap.fill(Qt.transparent)
-        
-        painter = QPainter(spinner_pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor(80, 80, 80, 80))
-        painter.drawEllipse(3, 3, 24, 24)
-        
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor(PRIMARY_COLOR))
-        
-        path = QPainterPath()
-        path.moveTo(15, 15)
-        path.arcTo(3, 3, 24, 24, self.spinner_angle, 120)
-        path.lineTo(15, 15)
-        painter.drawPath(path)
-        
-        painter.end()
-        
-        self.spinner_label.setPixmap(spinner_pixmap)
+        self.spinner_index = (self.spinner_index + 1) % SPINNER_FRAME_COUNT
+        self.spinner_label.setPixmap(get_spinner_frame(self.spinner_index))
 
     def play_minecraft(self):
         current_index = self.version_combo.currentIndex()
@@ -1540,7 +1662,7 @@ class NovaLauncher(QMainWindow):
             return
             
         version_data = self.version_combo.itemData(current_index)
-        if not version_data or not version_data.get("id"):
+        if not version_data or not version_data.id:
             QMessageBox.warning(self, "Warning", "Invalid version data selected!")
             return
         
@@ -1557,135 +1679,153 @@ class NovaLauncher(QMainWindow):
     def launch_minecraft(self):
         current_index = self.version_combo.currentIndex()
         if current_index < 0:
-            QMessageBox.critical(self, "Launch Error", "No version selected.")
-            self.hide_loading()
-            return
+            return self.fail_launch("No version selected.")
             
         version_data = self.version_combo.itemData(current_index)
         if not version_data:
-             QMessageBox.critical(self, "Launch Error", "Invalid version data.")
-             self.hide_loading()
-             return
+             return self.fail_launch("Invalid version data.")
 
-        version_id_to_launch = version_data.get("id")
-        version_type = version_data.get("type")
+        version_id_to_launch = version_data.id
+        version_type = version_data.type
 
         if version_type == "fabric":
             base_vanilla_id = version_id_to_launch
             try:
-                installed_versions = mclib.utils.get_installed_versions(self.minecraft_directory)
-                found_fabric_id = None
-                pattern = f"fabric-loader-"
-                for installed_ver in installed_versions:
-                    ver_id = installed_ver.get("id")
-                    if ver_id and ver_id.startswith(pattern) and ver_id.endswith(base_vanilla_id):
-                        found_fabric_id = ver_id
-                        break
+                found_fabric_id = self.get_versions_index().get((base_vanilla_id, "fabric"))
                 
                 if not found_fabric_id:
-                    QMessageBox.critical(self, "Launch Error", f"Could not find installed Fabric for {base_vanilla_id}. Please try installing it again.")
-                    self.hide_loading()
-                    return
+                    return self.fail_launch(f"Could not find installed Fabric for {base_vanilla_id}. Please try installing it again.")
                 
                 version_id_to_launch = found_fabric_id
 
             except Exception as e:
-                 QMessageBox.critical(self, "Launch Error", f"Error finding installed Fabric version: {e}")
-                 self.hide_loading()
-                 return
+                 return self.fail_launch(f"Error finding installed Fabric version: {e}")
         elif version_type == "forge":
             base_vanilla_id = version_id_to_launch
             try:
-                installed_versions = mclib.utils.get_installed_versions(self.minecraft_directory)
-                found_forge_id = None
-                for installed_ver in installed_versions:
-                    ver_id = installed_ver.get("id")
-                    if ver_id and base_vanilla_id in ver_id and "forge" in ver_id.lower():
-                        found_forge_id = ver_id
-                        break 
+                found_forge_id = self.get_versions_index().get((base_vanilla_id, "forge"))
                 
                 if not found_forge_id:
-                    QMessageBox.critical(self, "Launch Error", f"Could not find installed Forge for {base_vanilla_id}. Please try installing it again.")
-                    self.hide_loading()
-                    return
+                    return self.fail_launch(f"Could not find installed Forge for {base_vanilla_id}. Please try installing it again.")
                 
                 version_id_to_launch = found_forge_id
 
             except Exception as e:
-                 QMessageBox.critical(self, "Launch Error", f"Error finding installed Forge version: {e}")
-                 self.hide_loading()
-                 return
+                 return self.fail_launch(f"Error finding installed Forge version: {e}")
 
         if not version_id_to_launch:
-             QMessageBox.critical(self, "Launch Error", "Could not determine version to launch.")
-             self.hide_loading()
-             return
+             return self.fail_launch("Could not determine version to launch.")
 
-        self.launch_thread = MinecraftLauncherThread(
+        launch_args = (
             self.minecraft_directory,
             version_id_to_launch,
             self.username,  
             self.ram_allocation,
             self.java_path
         )
-        self.launch_thread.launch_signal.connect(self.launch_complete)
+        # Aynı thread nesnesi her başlatmada yeniden kullanılır
+        if self.launch_thread is None:
+            self.launch_thread = MinecraftLauncherThread(*launch_args)
+            self.launch_thread.launch_signal.connect(self.launch_complete)
+        elif self.launch_thread.isRunning():
+            # Önceki başlatma sürüyor; çağıranın açtığı yükleme ekranını kapat
+            self.hide_loading()
+            return
+        else:
+            self.launch_thread.configure(*launch_args)
         self.launch_thread.start()
     
+    def fail_launch(self, message):
+        self.hide_loading()
+        self.show_launch_error(message)
+    
+    def show_launch_error(self, message):
+        # Tek bir kutu yeniden kullanılır; hızlı tekrar denemelerde üst üste açılmaz
+        if self.launch_error_box is None:
+            self.launch_error_box = QMessageBox(QMessageBox.Critical, "Launch Error", "", QMessageBox.Ok, self)
+        self.launch_error_box.setText(message)
+        self.launch_error_box.exec_()
+    
     def launch_complete(self, success, message):
         if not success:
-            QMessageBox.critical(self, "Launch Error", message)
+            self.show_launch_error(message)
     
     def closeEvent(self, event):
+        self.closing = True
+        self.retire_version_thread()
+        self.save_timer.stop()
         self.save_settings()
+        self.save_forge_cache()
+        
+        # Çalışan bir QThread pencereyle birlikte yok edilmesin; ağ isteği
+        # takılırsa kapanışı da kilitlemesin diye bekleme süresi sınırlı
+        deadline = time.monotonic() + 3.0
+        for thread in list(self.retired_version_threads):
+            thread.wait(max(0, int((deadline - time.monotonic()) * 1000)))
         super().closeEvent(event)
 
+    def load_forge_cache(self):
+        # {"fetched_at": ..., "versions": {vanilla id: forge sürümü ya da null}}
+        try:
+            with open(self.forge_cache_path, 'r') as f:
+                cache = json.load(f)
+            if isinstance(cache.get("versions"), dict):
+                return {"fetched_at": cache.get("fetched_at", 0), "versions": cache["versions"]}
+        except Exception:
+            pass
+        return {"fetched_at": 0, "versions": {}}
+
+    def save_forge_cache(self):
+        # Forge'u olmayan sürümler de (null) kaydedilir; hepsi FORGE_CACHE_MAX_AGE sonra yeniden sorgulanır
+        cache = {"fetched_at": self.forge_cache["fetched_at"], "versions": self.forge_cache["versions"]}
+        try:
+            temp_path = self.forge_cache_path + ".tmp"
+            with open(temp_path, 'w') as f:
+                json.dump(cache, f)
+            os.replace(temp_path, self.forge_cache_path)
+        except Exception:
+            logger.debug("Could not save Forge cache", exc_info=True)
+
     def load_settings(self):
-        settings = {
-            "minecraft_directory": DEFAULT_MINECRAFT_DIR,
-            "username": "",
-            "last_used_version": None,
-            "last_version_type": None,
-            "ram_allocation": DEFAULT_SETTINGS["ram_allocation"],
-            "java_path": DEFAULT_SETTINGS["java_path"],
-            "show_fabric": DEFAULT_SETTINGS["show_fabric"],
-            "show_forge": DEFAULT_SETTINGS["show_forge"],
-            "show_snapshots": DEFAULT_SETTINGS["show_snapshots"]
-        }
+        settings = dict(LAUNCHER_DEFAULT_SETTINGS)
         
         try:
-            if os.path.exists(self.settings_file_path):
-                with open(self.settings_file_path, 'r') as f:
-                    loaded_settings = json.load(f)
-                    settings.update(loaded_settings)
-        except Exception as e:
-            pass
+            # Dosya yoksa open zaten FileNotFoundError verir
+            with open(self.settings_file_path, 'rb') as f:
+                data = f.read()
+                loaded_settings = parse_settings(data)
+                settings.update(loaded_settings)
+                self.saved_settings_data = data
+        except FileNotFoundError:
+            # İlk açılış: varsayılan ayarlar
+            logger.debug("No settings file yet")
+        except Exception:
+            logger.warning("Could not load settings", exc_info=True)
         
         return settings
     
     def save_settings(self):
-        settings = {
-            "minecraft_directory": self.minecraft_directory,
-            "username": self.username,
-            "last_used_version": self.selected_version,
-            "last_version_type": self.selected_version_type,
-            "ram_allocation": self.ram_allocation,
-            "java_path": self.java_path,
-            "show_fabric": self.show_fabric,
-            "show_forge": self.show_forge,
-            "show_snapshots": self.show_snapshots
-        }
+        settings = {key: getattr(self, attribute) for key, attribute in SETTINGS_ATTRIBUTES}
         
         try:
-            if not os.path.exists(self.minecraft_directory):
-                os.makedirs(self.minecraft_directory)
+            data = dump_settings(settings)
+            if data == self.saved_settings_data:
+                return
             
-            with open(self.settings_file_path, 'w') as f:
-                json.dump(settings, f)
-        except Exception as e:
-            pass
+            os.makedirs(self.minecraft_directory, exist_ok=True)
+            
+            # Yarım yazılmış dosya kalmasın: önce geçici dosya, sonra atomik değiştirme
+            temp_path = self.settings_file_path + ".tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, self.settings_file_path)
+            self.saved_settings_data = data
+        except Exception:
+            logger.exception("Could not save settings")
 
 def main():
     app = QApplication(sys.argv)
+    app.setStyleSheet(STYLESHEET)
     launcher = NovaLauncher()
     launcher.show()
     sys.exit(app.exec_())